@@ -3,6 +3,7 @@
 负责加载和管理项目配置、检测规则和用户设置
 """
 
+import copy
 import logging
 import os
 from pathlib import Path
@@ -14,6 +15,9 @@ from oops.core.path_resolver import PathResolver
 
 logger = logging.getLogger(__name__)
 
+# 优先使用 libyaml 实现的 CSafeLoader（PyYAML 未编译 libyaml 时回退到纯 Python 实现）
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigManager:
     """配置管理器"""
@@ -31,7 +35,7 @@ class ConfigManager:
 
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                self.master_config = yaml.safe_load(f)
+                self.master_config = yaml.load(f, Loader=_YAML_LOADER)
             logger.info(f"成功加载主配置文件: {config_path}")
             return True
         except Exception as e:
@@ -58,7 +62,7 @@ class ConfigManager:
 
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YAML_LOADER)
 
             # 解析路径配置
             self._resolve_paths(config, project_name)
@@ -253,31 +257,35 @@ class EnvironmentDependencyRule(DetectionRule):
         return {"status": "pending", "message": "环境检测待实现"}
 
 
-def create_default_master_config() -> Dict[str, Any]:
-    """创建默认主配置"""
-    return {
-        "version": "1.0",
-        "projects": {
-            "zenless_zone_zero": {
-                "enabled": True,
-                "config": "configs/zenless_zone_zero.yaml",
-                "description": "ZenlessZoneZero-OneDragon 项目",
-            },
-            "maa_assistant_arknights": {
-                "enabled": True,
-                "config": "configs/maa_assistant_arknights.yaml",
-                "description": "MAA明日方舟助手",
-            },
-            "generic_python": {
-                "enabled": True,
-                "config": "configs/generic_python.yaml",
-                "description": "通用Python项目",
-            },
+# 默认主配置模板，只在导入时构建一次；使用时返回深拷贝，调用方可以随意修改
+_DEFAULT_MASTER_TEMPLATE: Dict[str, Any] = {
+    "version": "1.0",
+    "projects": {
+        "zenless_zone_zero": {
+            "enabled": True,
+            "config": "configs/zenless_zone_zero.yaml",
+            "description": "ZenlessZoneZero-OneDragon 项目",
         },
-        "settings": {
-            "default_report_format": "html",
-            "enable_auto_fix": False,
-            "log_level": "INFO",
-            "max_concurrent_checks": 5,
+        "maa_assistant_arknights": {
+            "enabled": True,
+            "config": "configs/maa_assistant_arknights.yaml",
+            "description": "MAA明日方舟助手",
         },
-    }
+        "generic_python": {
+            "enabled": True,
+            "config": "configs/generic_python.yaml",
+            "description": "通用Python项目",
+        },
+    },
+    "settings": {
+        "default_report_format": "html",
+        "enable_auto_fix": False,
+        "log_level": "INFO",
+        "max_concurrent_checks": 5,
+    },
+}
+
+
+def create_default_master_config() -> Dict[str, Any]:
+    """创建默认主配置"""
+    return copy.deepcopy(_DEFAULT_MASTER_TEMPLATE)
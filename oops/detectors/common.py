@@ -0,0 +1,112 @@
+"""
+检测器公共工具
+子进程启动参数、PowerShell 调用和分辨率解析，供多个检测器共用
+"""
+
+import base64
+import functools
+import logging
+import re
+import subprocess
+import sys
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+logger = logging.getLogger(__name__)
+
+# 运行平台在进程生命周期内不变，导入时判断一次
+IS_WINDOWS = sys.platform == "win32"
+
+# 子进程不创建控制台窗口，并放入独立进程组，不接收控制台的 Ctrl+C
+# （这两个常量仅在 Windows 上存在）
+CREATION_FLAGS = (
+    subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP
+    if IS_WINDOWS
+    else 0
+)
+
+# 隐藏窗口的启动参数，只构建一次（subprocess 每次启动时会复制一份）
+STARTUPINFO = None
+if IS_WINDOWS:
+    STARTUPINFO = subprocess.STARTUPINFO()
+    STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    STARTUPINFO.wShowWindow = 0  # SW_HIDE
+
+# 分辨率字符串，如 "1920x1080"、"1920 x 1080"、"1920X1080"、"1920×1080"
+RES_RE = re.compile(r"(\d+)\s*[xX×]\s*(\d+)")
+
+
+def encode_ps(script: str) -> str:
+    """将 PowerShell 脚本编码为 -EncodedCommand 参数（UTF-16LE + Base64）"""
+    return base64.b64encode(script.encode("utf-16-le")).decode("ascii")
+
+
+def run_ps(encoded_script: str, timeout: float) -> subprocess.CompletedProcess:
+    """运行已编码的 PowerShell 脚本（不加载用户配置文件，不等待交互输入）
+
+    脚本以 -EncodedCommand 传递，避免多行脚本在命令行上的转义问题。
+    """
+    return subprocess.run(
+        [
+            "powershell",
+            "-NoProfile",
+            "-NonInteractive",
+            "-ExecutionPolicy",
+            "Bypass",
+            "-OutputFormat",
+            "Text",
+            "-EncodedCommand",
+            encoded_script,
+        ],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        creationflags=CREATION_FLAGS,
+        startupinfo=STARTUPINFO,
+    )
+
+
+def format_resolution(width: int, height: int) -> Optional[str]:
+    """校验分辨率范围并格式化为 "W x H"，超出合理范围时返回 None"""
+    if 800 <= width <= 7680 and 600 <= height <= 4320:
+        return f"{width} x {height}"
+    return None
+
+
+def primary_resolution() -> Optional[str]:
+    """获取主显示器分辨率（仅 Windows，失败或超出合理范围时返回 None）"""
+    if not IS_WINDOWS:
+        return None
+    try:
+        import ctypes
+
+        # 先声明 DPI 感知，避免缩放后返回逻辑分辨率
+        user32 = ctypes.windll.user32
+        user32.SetProcessDPIAware()
+        width = user32.GetSystemMetrics(0)  # SM_CXSCREEN
+        height = user32.GetSystemMetrics(1)  # SM_CYSCREEN
+        return format_resolution(width, height)
+    except Exception as e:
+        logger.debug(f"获取主显示器分辨率失败: {e}")
+    return None
+
+
+def cache_success(func: Callable[..., _T]) -> Callable[..., _T]:
+    """按参数缓存探测结果，只缓存成功的结果
+
+    空结果（None、空字典等）和 "Unknown" 视为探测失败，下次调用重新探测，
+    避免一次偶发失败在整个进程生命周期内被复用。
+    """
+    cache: Dict[tuple, Any] = {}
+
+    @functools.wraps(func)
+    def wrapper(*args: Any) -> _T:
+        if args in cache:
+            return cache[args]
+        value = func(*args)
+        if value and value != "Unknown":
+            cache[args] = value
+        return value
+
+    return wrapper
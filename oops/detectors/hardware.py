@@ -4,16 +4,140 @@
 """
 
 import logging
+import os
 import platform
+import shutil
 import subprocess
-from typing import Any, Dict, Optional
+from math import gcd
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import psutil
 
 from oops.core.config import DetectionRule
+from oops.detectors.common import (
+    CREATION_FLAGS,
+    RES_RE,
+    cache_success,
+    encode_ps,
+    primary_resolution,
+    run_ps,
+)
 
 logger = logging.getLogger(__name__)
 
+# 操作系统在进程生命周期内不变，导入时获取一次
+_SYSTEM = platform.system()
+
+_GB = 1024**3
+
+# 要求 SSD 时各磁盘类型对应的警告（SSD 无警告）
+_DISK_TYPE_WARNINGS = {
+    "HDD": "当前使用 HDD 硬盘，建议使用 SSD 以获得更好的性能",
+    "Unknown": "无法检测磁盘类型，建议确认是否使用 SSD",
+}
+
+
+def _wmic_values(output: str) -> Iterator[str]:
+    """逐行产出 wmic 单列输出中的值（跳过表头 "Name" 和空行）"""
+    return (
+        value
+        for value in (line.strip() for line in output.splitlines())
+        if value and value != "Name"
+    )
+
+
+def _format_display_item(key: str, value: Any) -> Optional[Tuple[str, Any]]:
+    """将一项原始数值转换为展示用的键值（单位后缀的空值项返回 None）"""
+    if key.endswith("_mhz"):
+        return None if value is None else (key[:-4], f"{value:.0f} MHz")
+    if key.endswith("_bytes"):
+        return None if value is None else (key[:-6], f"{value / _GB:.1f} GB")
+    if key == "percent" and value is not None:
+        return key, f"{value:.1f}%"
+    return key, value
+
+
+# CPU/GPU 型号与磁盘类型在进程生命周期内不变，探测成功的结果缓存复用
+@cache_success
+def _detect_cpu_model() -> Optional[str]:
+    """获取CPU型号"""
+    try:
+        if _SYSTEM == "Windows":
+            result = subprocess.run(
+                ["wmic", "cpu", "get", "name"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                creationflags=CREATION_FLAGS,
+            )
+            if result.returncode == 0:
+                # 跳过表头 "Name" 和空行，取第一个型号
+                return next(_wmic_values(result.stdout), None)
+        elif _SYSTEM == "Linux":
+            with open("/proc/cpuinfo", "r") as f:
+                for line in f:
+                    if line.startswith("model name"):
+                        return line.split(":", 1)[1].strip()
+        elif _SYSTEM == "Darwin":  # macOS
+            result = subprocess.run(
+                ["sysctl", "-n", "machdep.cpu.brand_string"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+            )
+            if result.returncode == 0:
+                return result.stdout.strip()
+    except Exception as e:
+        logger.debug(f"获取CPU型号失败: {e}")
+    return None
+
+
+@cache_success
+def _detect_gpu_info() -> Optional[str]:
+    """获取GPU信息"""
+    try:
+        if _SYSTEM == "Windows":
+            result = subprocess.run(
+                ["wmic", "path", "win32_VideoController", "get", "name"],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                creationflags=CREATION_FLAGS,
+            )
+            if result.returncode == 0:
+                return ", ".join(_wmic_values(result.stdout)) or None
+    except Exception as e:
+        logger.debug(f"获取GPU信息失败: {e}")
+    return None
+
+
+@cache_success
+def _detect_disk_type(drive: str) -> Optional[str]:
+    """检测磁盘类型（SSD/HDD）"""
+    try:
+        if _SYSTEM == "Windows":
+            # 使用 PowerShell 检测磁盘类型
+            drive_letter = drive.rstrip(":\\")
+            ps_command = f"""
+            $partition = Get-Partition -DriveLetter {drive_letter} -ErrorAction SilentlyContinue
+            if ($partition) {{
+                $disk = Get-PhysicalDisk -DeviceNumber $partition.DiskNumber -ErrorAction SilentlyContinue
+                if ($disk) {{
+                    $disk.MediaType
+                }}
+            }}
+            """
+            result = run_ps(encode_ps(ps_command), timeout=10)
+            if result.returncode == 0:
+                media_type = result.stdout.strip()
+                if "SSD" in media_type or "Solid" in media_type:
+                    return "SSD"
+                elif "HDD" in media_type or "Hard" in media_type:
+                    return "HDD"
+    except Exception as e:
+        logger.debug(f"检测磁盘类型失败: {e}")
+    return "Unknown"
+
 
 class HardwareDetector(DetectionRule):
     """硬件信息检测器 - 收集数据并进行硬件要求验证"""
@@ -29,13 +153,15 @@ class HardwareDetector(DetectionRule):
     def check(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """执行硬件信息检测"""
         try:
-            hardware_info = {
-                "cpu": self._get_cpu_info(),
-                "memory": self._get_memory_info(),
-                "gpu": self._get_gpu_info(),
-                "storage": self._get_storage_info(),
-                "display": self._get_display_info(),
-            }
+            hardware_info = self._format_for_display(
+                {
+                    "cpu": self._get_cpu_info(),
+                    "memory": self._get_memory_info(),
+                    "gpu": self._get_gpu_info(),
+                    "storage": self._get_storage_info(),
+                    "display": self._get_display_info(),
+                }
+            )
 
             # 进行硬件要求验证
             issues = []
@@ -64,10 +190,9 @@ class HardwareDetector(DetectionRule):
             disk_type = storage_info.get("type", "Unknown")
 
             if require_ssd:
-                if disk_type == "HDD":
-                    warnings.append(f"当前使用 HDD 硬盘，建议使用 SSD 以获得更好的性能")
-                elif disk_type == "Unknown":
-                    warnings.append("无法检测磁盘类型，建议确认是否使用 SSD")
+                disk_warning = _DISK_TYPE_WARNINGS.get(disk_type)
+                if disk_warning:
+                    warnings.append(disk_warning)
 
             # 验证屏幕比例（是否要求特定比例如 16:9）
             required_aspect_ratio = hardware_requirements.get("aspect_ratio")
@@ -121,8 +246,8 @@ class HardwareDetector(DetectionRule):
             # CPU频率
             cpu_freq = psutil.cpu_freq()
             if cpu_freq:
-                cpu_info["freq_current"] = f"{cpu_freq.current:.0f} MHz"
-                cpu_info["freq_max"] = f"{cpu_freq.max:.0f} MHz"
+                cpu_info["freq_current_mhz"] = cpu_freq.current
+                cpu_info["freq_max_mhz"] = cpu_freq.max
 
             # CPU型号
             cpu_model = self._get_cpu_model()
@@ -136,48 +261,17 @@ class HardwareDetector(DetectionRule):
 
     def _get_cpu_model(self) -> Optional[str]:
         """获取CPU型号"""
-        try:
-            if platform.system() == "Windows":
-                result = subprocess.run(
-                    ["wmic", "cpu", "get", "name"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                    creationflags=subprocess.CREATE_NO_WINDOW,
-                )
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split("\n")
-                    for line in lines:
-                        line = line.strip()
-                        if line and line != "Name":
-                            return line
-            elif platform.system() == "Linux":
-                with open("/proc/cpuinfo", "r") as f:
-                    for line in f:
-                        if line.startswith("model name"):
-                            return line.split(":", 1)[1].strip()
-            elif platform.system() == "Darwin":  # macOS
-                result = subprocess.run(
-                    ["sysctl", "-n", "machdep.cpu.brand_string"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode == 0:
-                    return result.stdout.strip()
-        except Exception as e:
-            logger.debug(f"获取CPU型号失败: {e}")
-        return None
+        return _detect_cpu_model()
 
     def _get_memory_info(self) -> Dict[str, Any]:
-        """获取内存信息"""
+        """获取内存信息（原始字节数）"""
         try:
             memory = psutil.virtual_memory()
             return {
-                "total": f"{memory.total / (1024**3):.1f} GB",
-                "available": f"{memory.available / (1024**3):.1f} GB",
-                "used": f"{memory.used / (1024**3):.1f} GB",
-                "percent": f"{memory.percent:.1f}%",
+                "total_bytes": memory.total,
+                "available_bytes": memory.available,
+                "used_bytes": memory.used,
+                "percent": memory.percent,
             }
         except Exception as e:
             logger.error(f"获取内存信息失败: {e}")
@@ -185,44 +279,26 @@ class HardwareDetector(DetectionRule):
 
     def _get_gpu_info(self) -> Optional[str]:
         """获取GPU信息"""
-        try:
-            if platform.system() == "Windows":
-                result = subprocess.run(
-                    ["wmic", "path", "win32_VideoController", "get", "name"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                    creationflags=subprocess.CREATE_NO_WINDOW,
-                )
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split("\n")
-                    gpus = []
-                    for line in lines:
-                        line = line.strip()
-                        if line and line != "Name":
-                            gpus.append(line)
-                    return ", ".join(gpus) if gpus else None
-        except Exception as e:
-            logger.debug(f"获取GPU信息失败: {e}")
-        return None
+        return _detect_gpu_info()
 
     def _get_storage_info(self) -> Dict[str, Any]:
-        """获取存储信息"""
+        """获取存储信息（原始字节数）"""
         try:
-            import os
-
             # 获取当前驱动器
-            current_drive = os.path.splitdrive(os.getcwd())[0] + os.sep
+            cwd = os.getcwd()
+            current_drive = os.path.splitdrive(cwd)[0] + os.sep
 
-            # 获取磁盘使用情况
-            disk_usage = psutil.disk_usage(current_drive)
+            # 获取磁盘使用情况（shutil 直接调用 statvfs/GetDiskFreeSpaceExW）
+            total, used, free = shutil.disk_usage(cwd)
+            # 与 psutil 一致：不计入仅 root 可用的保留空间
+            percent = used / (used + free) * 100 if used + free else 0.0
 
             storage_info = {
                 "current_drive": current_drive,
-                "total": f"{disk_usage.total / (1024**3):.1f} GB",
-                "used": f"{disk_usage.used / (1024**3):.1f} GB",
-                "free": f"{disk_usage.free / (1024**3):.1f} GB",
-                "percent": f"{disk_usage.percent:.1f}%",
+                "total_bytes": total,
+                "used_bytes": used,
+                "free_bytes": free,
+                "percent": percent,
             }
 
             # 检测磁盘类型
@@ -235,118 +311,64 @@ class HardwareDetector(DetectionRule):
             logger.error(f"获取存储信息失败: {e}")
             return {}
 
+    def _format_for_display(self, hardware_info: Dict[str, Any]) -> Dict[str, Any]:
+        """将原始数值转换为报告展示用的字符串（保持各项原有顺序）"""
+        display = dict(hardware_info)
+        for section in ("cpu", "memory", "storage"):
+            info = hardware_info.get(section)
+            if info:
+                display[section] = dict(
+                    item
+                    for item in (_format_display_item(*kv) for kv in info.items())
+                    if item is not None
+                )
+        return display
+
     def _get_disk_type(self, drive: str) -> Optional[str]:
         """检测磁盘类型（SSD/HDD）"""
-        try:
-            if platform.system() == "Windows":
-                # 使用 PowerShell 检测磁盘类型
-                drive_letter = drive.rstrip(":\\")
-                ps_command = f"""
-                $partition = Get-Partition -DriveLetter {drive_letter} -ErrorAction SilentlyContinue
-                if ($partition) {{
-                    $disk = Get-PhysicalDisk -DeviceNumber $partition.DiskNumber -ErrorAction SilentlyContinue
-                    if ($disk) {{
-                        $disk.MediaType
-                    }}
-                }}
-                """
-                result = subprocess.run(
-                    ["powershell", "-Command", ps_command],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    creationflags=subprocess.CREATE_NO_WINDOW,
-                )
-                if result.returncode == 0:
-                    media_type = result.stdout.strip()
-                    if "SSD" in media_type or "Solid" in media_type:
-                        return "SSD"
-                    elif "HDD" in media_type or "Hard" in media_type:
-                        return "HDD"
-        except Exception as e:
-            logger.debug(f"检测磁盘类型失败: {e}")
-        return "Unknown"
+        return _detect_disk_type(drive)
 
     def _get_display_info(self) -> Dict[str, Any]:
         """获取显示器信息"""
-        try:
-            if platform.system() == "Windows":
-                # 使用 PowerShell 获取主显示器分辨率
-                ps_command = """
-                Add-Type -AssemblyName System.Windows.Forms
-                $screen = [System.Windows.Forms.Screen]::PrimaryScreen
-                $width = $screen.Bounds.Width
-                $height = $screen.Bounds.Height
-                Write-Output "$width x $height"
-                """
-                result = subprocess.run(
-                    ["powershell", "-Command", ps_command],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                    creationflags=subprocess.CREATE_NO_WINDOW,
-                )
-                if result.returncode == 0:
-                    resolution = result.stdout.strip()
-                    return {"primary_resolution": resolution}
-        except Exception as e:
-            logger.debug(f"获取显示器信息失败: {e}")
-        return {}
+        resolution = primary_resolution()
+        return {"primary_resolution": resolution} if resolution else {}
 
     def _check_resolution_requirement(self, current: str, required: str) -> bool:
-        """检查分辨率是否满足要求"""
-        try:
-            # 解析当前分辨率
-            current_parts = current.replace(" ", "").split("x")
-            if len(current_parts) != 2:
-                return True  # 无法解析，跳过检查
-            current_width = int(current_parts[0])
-            current_height = int(current_parts[1])
-
-            # 解析要求分辨率
-            required_parts = required.replace(" ", "").split("x")
-            if len(required_parts) != 2:
-                return True  # 无法解析，跳过检查
-            required_width = int(required_parts[0])
-            required_height = int(required_parts[1])
-
-            # 检查是否满足要求
-            return current_width >= required_width and current_height >= required_height
-        except Exception as e:
-            logger.debug(f"检查分辨率要求失败: {e}")
-            return True  # 出错时跳过检查
+        """检查分辨率是否满足要求（无法解析时跳过检查）"""
+        # 配置值可能不是字符串（如 YAML 中写成 1080 或 null），视为无法解析
+        if not isinstance(current, str) or not isinstance(required, str):
+            return True
+        current_match = RES_RE.search(current)
+        required_match = RES_RE.search(required)
+        if not current_match or not required_match:
+            return True
+
+        current_width, current_height = int(current_match[1]), int(current_match[2])
+        required_width, required_height = int(required_match[1]), int(required_match[2])
+        return current_width >= required_width and current_height >= required_height
 
     def _check_aspect_ratio(
         self, resolution: str, required_ratio: str
     ) -> Dict[str, Any]:
         """检查屏幕比例是否符合要求"""
-        try:
-            # 解析分辨率
-            parts = resolution.replace(" ", "").split("x")
-            if len(parts) != 2:
-                return {"valid": True, "message": "无法解析分辨率"}
-
-            width = int(parts[0])
-            height = int(parts[1])
-
-            # 计算实际比例
-            from math import gcd
-
-            divisor = gcd(width, height)
-            actual_ratio = f"{width // divisor}:{height // divisor}"
-
-            # 比较比例
-            if actual_ratio != required_ratio:
-                return {
-                    "valid": False,
-                    "message": f"屏幕比例为 {actual_ratio}，建议使用 {required_ratio} 比例的分辨率（如 1920x1080）",
-                }
-
-            return {"valid": True, "message": f"屏幕比例符合要求: {actual_ratio}"}
+        match = RES_RE.search(resolution)
+        width = int(match[1]) if match else 0
+        height = int(match[2]) if match else 0
+        if not width or not height:
+            return {"valid": True, "message": "无法解析分辨率"}
+
+        # 计算实际比例
+        divisor = gcd(width, height)
+        actual_ratio = f"{width // divisor}:{height // divisor}"
+
+        # 比较比例
+        if actual_ratio != required_ratio:
+            return {
+                "valid": False,
+                "message": f"屏幕比例为 {actual_ratio}，建议使用 {required_ratio} 比例的分辨率（如 1920x1080）",
+            }
 
-        except Exception as e:
-            logger.debug(f"检查屏幕比例失败: {e}")
-            return {"valid": True, "message": "无法检查屏幕比例"}
+        return {"valid": True, "message": f"屏幕比例符合要求: {actual_ratio}"}
 
     def get_fix_suggestion(self, result: Dict[str, Any]) -> str:
         """获取修复建议"""
@@ -243,13 +243,7 @@ class PathValidationDetector(DetectionRule):
 
     def _contains_chinese(self, text: str) -> bool:
         """检查字符串是否包含中文字符"""
-        try:
-            for char in text:
-                if "\u4e00" <= char <= "\u9fff":
-                    return True
-            return False
-        except:
-            return False
+        return any("\u4e00" <= char <= "\u9fff" for char in text)
 
     def _analyze_path_status(self, results: Dict[str, Any]) -> str:
         """分析整体路径状态"""
@@ -6,13 +6,44 @@
 import logging
 import os
 import platform
+import struct
 import sys
 from typing import Any, Dict
 
 from oops.core.config import DetectionRule
+from oops.detectors.common import cache_success
 
 logger = logging.getLogger(__name__)
 
+# 用户名在进程生命周期内不变，导入时读取一次
+_USERNAME = os.environ.get("USERNAME") or os.environ.get("USER") or ""
+
+
+def _mask_username(text: str) -> str:
+    """隐藏路径中的用户名部分"""
+    return text.replace(_USERNAME, "[USER]") if _USERNAME else text
+
+
+# 操作系统信息在进程生命周期内不变，探测成功的结果缓存复用
+@cache_success
+def _detect_os_info() -> Dict[str, Any]:
+    """获取操作系统信息"""
+    try:
+        # platform.uname() 一次取得全部字段；architecture() 在 Unix 上会调用
+        # file 命令，改用指针宽度判断 32/64 位
+        uname = platform.uname()
+        return {
+            "name": uname.system,
+            "version": uname.version,
+            "release": uname.release,
+            "architecture": f"{struct.calcsize('P') * 8}bit",
+            "machine": uname.machine,
+            "processor": uname.processor,
+        }
+    except Exception as e:
+        logger.error(f"获取操作系统信息失败: {e}")
+        return {}
+
 
 class SystemDetector(DetectionRule):
     """系统信息检测器 - 收集操作系统和Python环境信息"""
@@ -44,31 +75,16 @@ class SystemDetector(DetectionRule):
 
     def _get_os_info(self) -> Dict[str, Any]:
         """获取操作系统信息"""
-        try:
-            return {
-                "name": platform.system(),
-                "version": platform.version(),
-                "release": platform.release(),
-                "architecture": platform.architecture()[0],
-                "machine": platform.machine(),
-                "processor": platform.processor(),
-            }
-        except Exception as e:
-            logger.error(f"获取操作系统信息失败: {e}")
-            return {}
+        # 返回副本，调用方可能会在结果上追加字段
+        return dict(_detect_os_info())
 
     def _get_python_info(self) -> Dict[str, Any]:
         """获取Python环境信息"""
         try:
-            # 获取Python路径，但隐藏用户名部分
-            python_exe = sys.executable
-            username = os.getenv("USERNAME") or os.getenv("USER", "")
-            if username:
-                python_exe = python_exe.replace(username, "[USER]")
-
             return {
                 "version": sys.version.split()[0],
-                "executable": python_exe,
+                # 获取Python路径，但隐藏用户名部分
+                "executable": _mask_username(sys.executable),
                 "implementation": platform.python_implementation(),
                 "compiler": platform.python_compiler(),
             }
@@ -80,18 +96,9 @@ class SystemDetector(DetectionRule):
         """获取路径信息"""
         try:
             # 获取当前路径，但隐藏用户名部分
-            current_path = os.getcwd()
-            username = os.getenv("USERNAME") or os.getenv("USER", "")
-            if username:
-                current_path = current_path.replace(username, "[USER]")
-
             return {
-                "current": current_path,
-                "home": (
-                    os.path.expanduser("~").replace(username, "[USER]")
-                    if username
-                    else os.path.expanduser("~")
-                ),
+                "current": _mask_username(os.getcwd()),
+                "home": _mask_username(os.path.expanduser("~")),
             }
         except Exception as e:
             logger.error(f"获取路径信息失败: {e}")
@@ -4,6 +4,7 @@
 """
 
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Dict
 
 from oops.core.config import DetectionRule
@@ -31,62 +32,57 @@ class SystemInfoDetector(DetectionRule):
     def check(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """执行系统信息检测 - 协调多个子检测器"""
         try:
-            # 调用各个子检测器
-            hardware_result = self.hardware_detector.check(config)
-            system_result = self.system_detector.check(config)
-            settings_result = self.system_settings_detector.check(config)
+            # 并发调用各个子检测器（均为子进程/注册表等 I/O 等待，互不依赖）
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                hardware_future = executor.submit(self.hardware_detector.check, config)
+                system_future = executor.submit(self.system_detector.check, config)
+                settings_future = executor.submit(
+                    self.system_settings_detector.check, config
+                )
+            # 单个子检测器失败时只影响自己的结果，其余结果照常合并
+            hardware_result = self._future_result(hardware_future, "硬件信息")
+            system_result = self._future_result(system_future, "系统信息")
+            settings_result = self._future_result(settings_future, "系统设置")
+
+            hardware_status = hardware_result.get("status")
+            system_status = system_result.get("status")
 
             # 合并结果
             combined_details = {}
 
             # 添加硬件信息
-            if hardware_result.get("status") == "success":
+            if hardware_status == "success":
                 hardware_details = hardware_result.get("details", {})
-                combined_details.update(
-                    {
-                        "hardware": hardware_details.get("cpu", {}),
-                        "memory": hardware_details.get("memory", {}),
-                        "gpu": hardware_details.get("gpu"),
-                        "storage": hardware_details.get("storage", {}),
-                    }
-                )
+                combined_details["hardware"] = hardware_details.get("cpu", {})
+                combined_details["memory"] = hardware_details.get("memory", {})
+                combined_details["gpu"] = hardware_details.get("gpu")
+                combined_details["storage"] = hardware_details.get("storage", {})
 
-            # 添加系统信息
-            if system_result.get("status") == "success":
+            # 添加系统信息（系统设置中的显示信息一并归入 basic）
+            if system_status == "success":
                 system_details = system_result.get("details", {})
-                combined_details.update(
-                    {
-                        "basic": system_details.get("os", {}),
-                        "python": system_details.get("python", {}),
-                        "paths": system_details.get("paths", {}),
-                    }
-                )
-
-            # 添加系统设置信息
-            if settings_result.get("status") == "success":
-                settings_details = settings_result.get("details", {})
-                settings_data = settings_details.get("settings", {})
-                if combined_details.get("basic"):
-                    combined_details["basic"].update(
-                        {
-                            "hdr_enabled": settings_data.get("hdr_enabled", False),
-                            "night_light_enabled": settings_data.get(
-                                "night_light_enabled", False
-                            ),
-                            "color_filter_enabled": settings_data.get(
-                                "color_filter_enabled", False
-                            ),
-                            "primary_resolution": settings_data.get(
-                                "primary_resolution"
-                            ),
-                        }
+                basic = system_details.get("os", {})
+                if basic and settings_result.get("status") == "success":
+                    settings_data = settings_result.get("details", {}).get(
+                        "settings", {}
                     )
+                    basic = {
+                        **basic,
+                        "hdr_enabled": settings_data.get("hdr_enabled", False),
+                        "night_light_enabled": settings_data.get(
+                            "night_light_enabled", False
+                        ),
+                        "color_filter_enabled": settings_data.get(
+                            "color_filter_enabled", False
+                        ),
+                        "primary_resolution": settings_data.get("primary_resolution"),
+                    }
+                combined_details["basic"] = basic
+                combined_details["python"] = system_details.get("python", {})
+                combined_details["paths"] = system_details.get("paths", {})
 
             # 确定整体状态 - 系统信息只关注数据收集，不关注验证结果
-            if any(
-                result.get("status") == "error"
-                for result in [hardware_result, system_result]
-            ):
+            if hardware_status == "error" or system_status == "error":
                 status = "error"
                 message = "系统信息收集部分失败"
             else:
@@ -103,6 +99,14 @@ class SystemInfoDetector(DetectionRule):
             logger.error(f"系统信息检测失败: {e}")
             return {"status": "error", "message": f"系统信息检测失败: {str(e)}"}
 
+    def _future_result(self, future: Future, label: str) -> Dict[str, Any]:
+        """取出子检测器的结果，抛出异常时转换为错误结果"""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"{label}检测失败: {e}")
+            return {"status": "error", "message": f"{label}检测失败: {str(e)}"}
+
     def get_fix_suggestion(self, result: Dict[str, Any]) -> str:
         """获取修复建议"""
         # 系统信息协调器不提供修复建议，因为它只负责数据收集
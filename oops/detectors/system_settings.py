@@ -3,19 +3,134 @@
 检测显示设置（HDR、夜间模式、分辨率等）和其他可能影响游戏脚本的系统设置
 """
 
+import copy
+import functools
+import hashlib
+import json
 import logging
-import platform
-import subprocess
+import time
 from typing import Any, Dict, Optional
 
 from oops.core.config import DetectionRule
+from oops.detectors.common import (
+    IS_WINDOWS,
+    RES_RE,
+    encode_ps,
+    format_resolution,
+    primary_resolution,
+    run_ps,
+)
 
 logger = logging.getLogger(__name__)
 
+# Windows 专用模块只在 Windows 上导入，其他平台不承担导入开销
+if IS_WINDOWS:
+    import ctypes
+    import winreg
+    from ctypes import wintypes
+
+# 显示设置很少变化，同一进程内短时间重复检测时直接复用结果
+_CACHE_TTL = 30.0
+_SETTINGS_CACHE: Dict[str, Any] = {"data": None, "ts": 0.0}
+# 完整检测结果同样缓存，按 system_settings 配置的摘要区分
+_CHECK_CACHE: Dict[str, Any] = {"key": None, "result": None, "ts": 0.0}
+
+# 显示方向代码（与 DEVMODE.dmDisplayOrientation 取值一致）
+_ORIENTATION_NAMES = {
+    0: "Landscape (横向)",
+    1: "Portrait (纵向)",
+    2: "Landscape (横向翻转)",
+    3: "Portrait (纵向翻转)",
+}
+
+# MonitorFromPoint / GetDpiForMonitor 参数
+_MONITOR_DEFAULTTOPRIMARY = 1
+_MDT_EFFECTIVE_DPI = 0
+
+# SetThreadDpiAwarenessContext 参数（Windows 10 1703+）
+_DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2 = -4
+
+# EnumDisplaySettingsW 的 iModeNum 参数，表示读取当前显示模式
+_ENUM_CURRENT_SETTINGS = -1
+
+
+if IS_WINDOWS:
+
+    class _DEVMODEW(ctypes.Structure):
+        """Win32 DEVMODEW 结构（显示设备部分）"""
+
+        _fields_ = [
+            ("dmDeviceName", wintypes.WCHAR * 32),
+            ("dmSpecVersion", wintypes.WORD),
+            ("dmDriverVersion", wintypes.WORD),
+            ("dmSize", wintypes.WORD),
+            ("dmDriverExtra", wintypes.WORD),
+            ("dmFields", wintypes.DWORD),
+            ("dmPositionX", wintypes.LONG),
+            ("dmPositionY", wintypes.LONG),
+            ("dmDisplayOrientation", wintypes.DWORD),
+            ("dmDisplayFixedOutput", wintypes.DWORD),
+            ("dmColor", wintypes.SHORT),
+            ("dmDuplex", wintypes.SHORT),
+            ("dmYResolution", wintypes.SHORT),
+            ("dmTTOption", wintypes.SHORT),
+            ("dmCollate", wintypes.SHORT),
+            ("dmFormName", wintypes.WCHAR * 32),
+            ("dmLogPixels", wintypes.WORD),
+            ("dmBitsPerPel", wintypes.DWORD),
+            ("dmPelsWidth", wintypes.DWORD),
+            ("dmPelsHeight", wintypes.DWORD),
+            ("dmDisplayFlags", wintypes.DWORD),
+            ("dmDisplayFrequency", wintypes.DWORD),
+            ("dmICMMethod", wintypes.DWORD),
+            ("dmICMIntent", wintypes.DWORD),
+            ("dmMediaType", wintypes.DWORD),
+            ("dmDitherType", wintypes.DWORD),
+            ("dmReserved1", wintypes.DWORD),
+            ("dmReserved2", wintypes.DWORD),
+            ("dmPanningWidth", wintypes.DWORD),
+            ("dmPanningHeight", wintypes.DWORD),
+        ]
+
+
+# 进程的管理员权限在其生命周期内不变，检测结果缓存复用
+@functools.lru_cache(maxsize=1)
+def _is_admin_cached() -> bool:
+    """检测当前进程是否有管理员权限"""
+    # 使用 shell32.IsUserAnAdmin() 检查当前进程是否有管理员权限
+    # 这个方法不会触发 UAC，只是检查当前进程的权限状态
+    return ctypes.windll.shell32.IsUserAnAdmin() != 0
+
 
 class SystemSettingsDetector(DetectionRule):
     """系统设置检测器 - 检测可能影响游戏脚本的系统设置"""
 
+    # 批量查询分辨率、缩放比例和显示方向的备用 PowerShell 脚本
+    # 输出一行 JSON 对象，查询失败的项不包含在内
+    _PS_DISPLAY_QUERY = r"""
+    $video = Get-CimInstance -Namespace root\cimv2 -ClassName Win32_VideoController `
+        -ErrorAction SilentlyContinue | Select-Object -First 1
+    $monitor = Get-CimInstance -Namespace root\cimv2 -ClassName Win32_DesktopMonitor `
+        -ErrorAction SilentlyContinue | Select-Object -First 1
+    $result = @{}
+    if ($video -and $video.CurrentHorizontalResolution) {
+        $result.Resolution = "$($video.CurrentHorizontalResolution) x $($video.CurrentVerticalResolution)"
+    }
+    if ($monitor -and $monitor.PixelsPerXLogicalInch) {
+        $result.Scaling = [int][math]::Round(($monitor.PixelsPerXLogicalInch / 96) * 100)
+    }
+    if ($monitor -and $monitor.DisplayOrientation -ne $null) {
+        $result.Orientation = [int]$monitor.DisplayOrientation
+    } elseif ($video -and $video.CurrentHorizontalResolution) {
+        if ($video.CurrentVerticalResolution -gt $video.CurrentHorizontalResolution) {
+            $result.Orientation = 1
+        } else {
+            $result.Orientation = 0
+        }
+    }
+    $result | ConvertTo-Json -Compress
+    """
+
     def __init__(self):
         super().__init__(
             name="system_settings",
@@ -23,14 +138,65 @@ class SystemSettingsDetector(DetectionRule):
             severity="warning",
         )
         self.timeout = 10
+        self._enabled = IS_WINDOWS
+        # 备用 PowerShell 脚本只编码一次
+        self._encoded_display_query = encode_ps(self._PS_DISPLAY_QUERY)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """清空显示设置和检测结果缓存，下次检测重新读取"""
+        _SETTINGS_CACHE.update(data=None, ts=0.0)
+        _CHECK_CACHE.update(key=None, result=None, ts=0.0)
 
     def check(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """执行系统设置检测"""
+        if not self._enabled:
+            return {
+                "status": "success",
+                "message": "非 Windows 平台，跳过系统设置检测",
+                "details": {
+                    "settings": {},
+                    "issues": [],
+                    "warnings": [],
+                    "recommendations": [],
+                },
+            }
+
         try:
+            # 获取系统设置配置（只遍历一次，键存在时不分配默认字典）
+            system_settings_config = (config.get("checks") or {}).get(
+                "system_settings"
+            ) or {}
+
+            # 配置相同且缓存未过期时直接返回上次的结果
+            cache_key = hashlib.blake2b(
+                json.dumps(system_settings_config, sort_keys=True, default=str).encode(
+                    "utf-8"
+                ),
+                digest_size=16,
+            ).digest()
+            if (
+                _CHECK_CACHE["key"] == cache_key
+                and time.monotonic() - _CHECK_CACHE["ts"] < _CACHE_TTL
+            ):
+                return copy.deepcopy(_CHECK_CACHE["result"])
+
             settings = self._get_display_settings()
 
-            # 获取系统设置配置
-            system_settings_config = config.get("checks", {}).get("system_settings", {})
+            # 一次取出全部设置项
+            settings_get = settings.get
+            is_admin = settings_get("is_admin")
+            hdr_enabled = settings_get("hdr_enabled")
+            night_light_enabled = settings_get("night_light_enabled")
+            color_filter_enabled = settings_get("color_filter_enabled")
+            resolution = settings_get("primary_resolution")
+            scaling = settings_get("scaling_factor")
+            orientation = settings_get("orientation")
+
+            require_admin = system_settings_config.get("require_admin", False)
+            game_settings_reminder = system_settings_config.get(
+                "game_settings_reminder", []
+            )
 
             # 分析设置问题
             issues = []
@@ -38,43 +204,33 @@ class SystemSettingsDetector(DetectionRule):
             recommendations = []
 
             # 检查管理员权限
-            require_admin = system_settings_config.get("require_admin", False)
-            is_admin = settings.get("is_admin")
-
             if require_admin and is_admin is False:
                 issues.append("未以管理员权限运行")
                 recommendations.append("请右键点击程序，选择「以管理员身份运行」")
 
             # 检查 HDR
-            if settings.get("hdr_enabled") is True:
+            if hdr_enabled is True:
                 issues.append("HDR已启用")
                 recommendations.append("关闭HDR以避免影响游戏脚本的图像识别")
 
             # 检查夜间模式
-            if settings.get("night_light_enabled") is True:
+            if night_light_enabled is True:
                 warnings.append("夜间模式/护眼模式已启用")
                 recommendations.append("关闭夜间模式以避免色温变化影响识别")
 
             # 检查颜色滤镜
-            if settings.get("color_filter_enabled") is True:
+            if color_filter_enabled is True:
                 issues.append("颜色滤镜已启用")
                 recommendations.append("关闭颜色滤镜以避免颜色失真影响识别")
 
             # 检查分辨率
-            resolution = settings.get("primary_resolution")
             if resolution:
                 resolution_check = self._validate_resolution(resolution)
                 if not resolution_check["valid"]:
-                    if resolution_check["severity"] == "error":
-                        issues.append(f"主显示器分辨率过低: {resolution}")
-                        recommendations.append(
-                            "游戏脚本要求最低分辨率 1920x1080，请调整显示器分辨率"
-                        )
-                    else:
-                        warnings.append(f"显示器分辨率: {resolution}")
-                        recommendations.append(
-                            "建议使用 1920x1080 或更高分辨率以获得最佳识别效果"
-                        )
+                    issues.append(f"主显示器分辨率过低: {resolution}")
+                    recommendations.append(
+                        "游戏脚本要求最低分辨率 1920x1080，请调整显示器分辨率"
+                    )
             elif resolution is None:
                 # 检测失败时显示 N/A
                 warnings.append("主显示器分辨率: N/A")
@@ -83,7 +239,6 @@ class SystemSettingsDetector(DetectionRule):
                 )
 
             # 检查屏幕缩放比例
-            scaling = settings.get("scaling_factor")
             if scaling is not None:
                 if scaling != 100:
                     warnings.append(f"屏幕缩放比例: {scaling}%")
@@ -95,7 +250,6 @@ class SystemSettingsDetector(DetectionRule):
                 recommendations.append("无法检测屏幕缩放比例，请手动确认设置为100%")
 
             # 检查显示方向
-            orientation = settings.get("orientation")
             if orientation is not None:
                 if "Portrait" in orientation:
                     warnings.append(f"显示方向: {orientation}")
@@ -106,11 +260,6 @@ class SystemSettingsDetector(DetectionRule):
                 warnings.append("显示方向: N/A")
                 recommendations.append("无法检测显示方向，请手动确认使用横向显示")
 
-            # 获取游戏内设置提醒
-            game_settings_reminder = system_settings_config.get(
-                "game_settings_reminder", []
-            )
-
             # 确定状态
             if issues:
                 status = "error"
@@ -133,21 +282,29 @@ class SystemSettingsDetector(DetectionRule):
             if game_settings_reminder:
                 details["game_settings_reminder"] = game_settings_reminder
 
-            return {
+            result = {
                 "status": status,
                 "message": message,
                 "details": details,
             }
+            _CHECK_CACHE["key"] = cache_key
+            _CHECK_CACHE["result"] = copy.deepcopy(result)
+            _CHECK_CACHE["ts"] = time.monotonic()
+            return result
         except Exception as e:
             logger.error(f"系统设置检测失败: {e}")
             return {"status": "error", "message": f"系统设置检测失败: {str(e)}"}
 
     def _get_display_settings(self) -> Dict[str, Any]:
-        """获取显示设置"""
+        """获取显示设置（结果缓存 _CACHE_TTL 秒）"""
+        cached = _SETTINGS_CACHE["data"]
+        if cached is not None and time.monotonic() - _SETTINGS_CACHE["ts"] < _CACHE_TTL:
+            return dict(cached)
+
         settings = {}
 
         try:
-            if platform.system() == "Windows":
+            if IS_WINDOWS:
                 # 检测管理员权限（不触发 UAC）
                 settings["is_admin"] = self._check_admin_windows()
 
@@ -160,55 +317,53 @@ class SystemSettingsDetector(DetectionRule):
                 # 检测颜色滤镜
                 settings["color_filter_enabled"] = self._check_color_filter_windows()
 
-                # 获取主显示器分辨率
-                settings["primary_resolution"] = self._get_primary_resolution_windows()
-
-                # 获取屏幕缩放比例
+                # 获取主显示器分辨率、屏幕缩放比例和显示方向
+                settings["primary_resolution"] = primary_resolution()
                 settings["scaling_factor"] = self._get_scaling_windows()
-
-                # 获取显示方向
                 settings["orientation"] = self._get_orientation_windows()
 
+                # 任一项直接读取失败时，通过一次 PowerShell 调用补全
+                if None in (
+                    settings["primary_resolution"],
+                    settings["scaling_factor"],
+                    settings["orientation"],
+                ):
+                    for key, value in self._collect_all_windows().items():
+                        if settings.get(key) is None:
+                            settings[key] = value
+
         except Exception as e:
             logger.debug(f"获取显示设置失败: {e}")
 
-        return settings
+        _SETTINGS_CACHE["data"] = settings
+        _SETTINGS_CACHE["ts"] = time.monotonic()
+        return dict(settings)
 
     def _check_admin_windows(self) -> Optional[bool]:
         """检测是否以管理员权限运行（不触发 UAC）"""
         try:
-            import ctypes
-
-            # 使用 shell32.IsUserAnAdmin() 检查当前进程是否有管理员权限
-            # 这个方法不会触发 UAC，只是检查当前进程的权限状态
-            return ctypes.windll.shell32.IsUserAnAdmin() != 0
+            return _is_admin_cached()
         except Exception as e:
             logger.debug(f"检测管理员权限失败: {e}")
             return None
 
+    def _read_registry_value(self, key_path: str, value_name: str) -> Any:
+        """读取 HKCU 下的注册表值，键或值不存在时返回 None"""
+        try:
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, key_path) as key:
+                return winreg.QueryValueEx(key, value_name)[0]
+        except FileNotFoundError:
+            return None
+
     def _check_hdr_windows(self) -> Optional[bool]:
         """检测Windows HDR状态"""
         try:
-            # 正确的HDR检测方法：读取注册表
-            ps_command = r"""
-            $hdrKey = 'HKCU:\Software\Microsoft\Windows\'
-            'CurrentVersion\VideoSettings'
-            if (Test-Path $hdrKey) {
-                $hdrValue = Get-ItemProperty -Path $hdrKey -Name 'EnableHDR' `
-                -ErrorAction SilentlyContinue
-                if ($hdrValue -and $hdrValue.EnableHDR -eq 1) { $true } else { $false }
-            } else { $false }
-            """
-            result = subprocess.run(
-                ["powershell", "-Command", ps_command],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                timeout=self.timeout,
-                creationflags=subprocess.CREATE_NO_WINDOW,
+            # 直接读取注册表，避免为单个值启动 PowerShell
+            value = self._read_registry_value(
+                r"Software\Microsoft\Windows\CurrentVersion\VideoSettings",
+                "EnableHDR",
             )
-            if result.returncode == 0:
-                return "True" in result.stdout
+            return value == 1
         except Exception as e:
             logger.debug(f"检测HDR失败: {e}")
         return None
@@ -216,34 +371,19 @@ class SystemSettingsDetector(DetectionRule):
     def _check_night_light_windows(self) -> Optional[bool]:
         """检测Windows夜间模式状态"""
         try:
-            # 正确的夜间模式检测：检查Data字段的第18个字节
-            ps_path = (
-                r"HKCU:\Software\Microsoft\Windows\CurrentVersion\CloudStore"
+            # 夜间模式状态保存在 Data 二进制值的第18个字节
+            data = self._read_registry_value(
+                r"Software\Microsoft\Windows\CurrentVersion\CloudStore"
                 r"\Store\DefaultAccount\Current"
                 r"\default$windows.data.bluelightreduction."
                 r"bluelightreductionstate"
                 r"\windows.data.bluelightreduction."
-                r"bluelightreductionstate"
+                r"bluelightreductionstate",
+                "Data",
             )
-            ps_command = rf"""
-            $path = '{ps_path}'
-            if (Test-Path $path) {{
-                $value = Get-ItemProperty -Path $path -Name Data `
-                -ErrorAction SilentlyContinue
-                if ($value -and $value.Data -and $value.Data.Length -gt 18) {{
-                    if ($value.Data[18] -eq 0x15) {{ $true }} else {{ $false }}
-                }} else {{ $false }}
-            }} else {{ $false }}
-            """
-            result = subprocess.run(
-                ["powershell", "-Command", ps_command],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
-            if result.returncode == 0:
-                return "True" in result.stdout
+            if isinstance(data, bytes) and len(data) > 18:
+                return data[18] == 0x15
+            return False
         except Exception as e:
             logger.debug(f"检测夜间模式失败: {e}")
         return None
@@ -251,131 +391,84 @@ class SystemSettingsDetector(DetectionRule):
     def _check_color_filter_windows(self) -> Optional[bool]:
         """检测Windows颜色滤镜状态"""
         try:
-            ps_command = r"""
-            $path = 'HKCU:\Software\Microsoft\ColorFiltering'
-            if (Test-Path $path) {
-                $value = Get-ItemProperty -Path $path `
-                -Name Active -ErrorAction SilentlyContinue
-                if ($value.Active -eq 1) { $true } else { $false }
-            } else { $false }
-            """
-            result = subprocess.run(
-                ["powershell", "-Command", ps_command],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                creationflags=subprocess.CREATE_NO_WINDOW,
+            value = self._read_registry_value(
+                r"Software\Microsoft\ColorFiltering", "Active"
             )
-            if result.returncode == 0:
-                return "True" in result.stdout
+            return value == 1
         except Exception as e:
             logger.debug(f"检测颜色滤镜失败: {e}")
         return None
 
-    def _get_primary_resolution_windows(self) -> Optional[str]:
-        """获取Windows主显示器分辨率"""
+    def _get_orientation_windows(self) -> Optional[str]:
+        """获取Windows显示方向"""
         try:
-            # 使用更可靠的方法获取分辨率
-            ps_command = r"""
-            $monitors = Get-WmiObject -Namespace root\wmi `
-            -Class WmiMonitorBasicDisplayParams
-            $primary = $monitors | Where-Object `
-            { $_.IsPrimary -eq $true } | Select-Object -First 1
-            if ($primary) {
-                "$($primary.MaxHorizontalImageSize)00 x `
-                $($primary.MaxVerticalImageSize)00"
-            } else {
-                $display = Get-CimInstance -Namespace `
-                root\cimv2 -ClassName Win32_VideoController | Select-Object -First 1
-                if ($display) {
-                    "$($display.CurrentHorizontalResolution) x `
-                    $($display.CurrentVerticalResolution)"
-                }
-            }
-            """
-            result = subprocess.run(
-                ["powershell", "-Command", ps_command],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                resolution = result.stdout.strip()
-                # 验证分辨率是否合理（避免返回明显错误的值）
-                if resolution and " x " in resolution:
-                    parts = resolution.split(" x ")
-                    if len(parts) == 2:
-                        try:
-                            width = int(parts[0])
-                            height = int(parts[1])
-                            # 检查是否是合理的分辨率范围
-                            if 800 <= width <= 7680 and 600 <= height <= 4320:
-                                return resolution
-                        except ValueError:
-                            pass
+            devmode = _DEVMODEW()
+            devmode.dmSize = ctypes.sizeof(_DEVMODEW)
+            if ctypes.windll.user32.EnumDisplaySettingsW(
+                None, _ENUM_CURRENT_SETTINGS, ctypes.byref(devmode)
+            ):
+                return _ORIENTATION_NAMES.get(devmode.dmDisplayOrientation)
         except Exception as e:
-            logger.debug(f"获取分辨率失败: {e}")
+            logger.debug(f"获取显示方向失败: {e}")
         return None
 
-    def _validate_resolution(self, resolution: str) -> Dict[str, Any]:
-        """验证分辨率是否符合要求"""
-        try:
-            # 解析分辨率字符串 "1920 x 1080"
-            parts = resolution.split("x")
-            if len(parts) == 2:
-                width = int(parts[0].strip())
-                height = int(parts[1].strip())
-
-                # 最低要求 1920x1080
-                if width < 1920 or height < 1080:
-                    return {
-                        "valid": False,
-                        "severity": "error",
-                        "message": f"分辨率过低: {resolution}",
-                    }
-                # 推荐 1920x1080 或更高
-                elif width < 1920 or height < 1080:
-                    return {
-                        "valid": False,
-                        "severity": "warning",
-                        "message": f"分辨率偏低: {resolution}",
-                    }
-                else:
-                    return {"valid": True, "message": f"分辨率正常: {resolution}"}
-        except Exception as e:
-            logger.debug(f"验证分辨率失败: {e}")
-
-        return {"valid": True, "message": "无法验证分辨率"}
-
     def _get_scaling_windows(self) -> Optional[int]:
-        """获取Windows屏幕缩放比例"""
+        """获取Windows屏幕缩放比例（主显示器当前生效的 DPI）
+
+        注册表中的 AppliedDPI 和系统 DPI 在用户重新登录前都不会更新。
+        查询期间把当前线程临时切换为按显示器感知 DPI，GetDpiForMonitor
+        才会返回实时值；系统不支持线程 DPI 感知上下文时只能得到系统 DPI。
+        """
         try:
-            ps_command = r"""
-            $dpi = Get-ItemProperty -Path `
-            'HKCU:\Control Panel\Desktop\WindowMetrics' `
-            -Name 'AppliedDPI' -ErrorAction SilentlyContinue
-            if ($dpi -and $dpi.AppliedDPI) {
-                # AppliedDPI值为96表示100%，120表示125%，144表示150%，等等
-                [math]::Round(($dpi.AppliedDPI / 96) * 100)
-            } else {
-                # 备用方法：使用WMI
-                $display = Get-WmiObject -Namespace `
-                root\cimv2 -Class Win32_DesktopMonitor | Select-Object -First 1
-                if ($display -and $display.PixelsPerXLogicalInch) {
-                    [math]::Round(($display.PixelsPerXLogicalInch / 96) * 100)
-                }
-            }
-            """
-            result = subprocess.run(
-                ["powershell", "-Command", ps_command],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                scaling = int(result.stdout.strip())
+            user32 = ctypes.windll.user32
+            user32.SetProcessDPIAware()
+            previous_context = None
+            try:
+                set_thread_context = user32.SetThreadDpiAwarenessContext
+                set_thread_context.argtypes = [wintypes.HANDLE]
+                set_thread_context.restype = wintypes.HANDLE
+                previous_context = set_thread_context(
+                    _DPI_AWARENESS_CONTEXT_PER_MONITOR_AWARE_V2
+                )
+            except AttributeError:
+                set_thread_context = None
+            try:
+                # Windows 8.1+：主显示器的有效 DPI
+                # 声明参数和返回类型，64 位系统上 HMONITOR 句柄才不会被截断为 int
+                monitor_from_point = user32.MonitorFromPoint
+                monitor_from_point.argtypes = [wintypes.POINT, wintypes.DWORD]
+                monitor_from_point.restype = wintypes.HMONITOR
+                get_dpi_for_monitor = ctypes.windll.shcore.GetDpiForMonitor
+                get_dpi_for_monitor.argtypes = [
+                    wintypes.HMONITOR,
+                    ctypes.c_int,
+                    ctypes.POINTER(wintypes.UINT),
+                    ctypes.POINTER(wintypes.UINT),
+                ]
+
+                monitor = monitor_from_point(
+                    wintypes.POINT(0, 0), _MONITOR_DEFAULTTOPRIMARY
+                )
+                dpi_x, dpi_y = wintypes.UINT(), wintypes.UINT()
+                if get_dpi_for_monitor(
+                    monitor,
+                    _MDT_EFFECTIVE_DPI,
+                    ctypes.byref(dpi_x),
+                    ctypes.byref(dpi_y),
+                ):
+                    raise OSError("GetDpiForMonitor failed")
+                dpi = dpi_x.value
+            except (AttributeError, OSError):
+                # 没有 shcore.GetDpiForMonitor 时回退到系统 DPI
+                dpi = user32.GetDpiForSystem()
+            finally:
+                # 恢复线程原来的 DPI 感知上下文
+                if previous_context:
+                    set_thread_context(previous_context)
+
+            # DPI 为96表示100%，120表示125%，144表示150%，等等
+            if dpi:
+                scaling = round(dpi / 96 * 100)
                 # 验证缩放比例是否合理
                 if 100 <= scaling <= 300:
                     return scaling
@@ -383,51 +476,68 @@ class SystemSettingsDetector(DetectionRule):
             logger.debug(f"获取屏幕缩放比例失败: {e}")
         return None
 
-    def _get_orientation_windows(self) -> Optional[str]:
-        """获取Windows显示方向"""
+    def _collect_all_windows(self) -> Dict[str, Any]:
+        """一次 PowerShell 调用获取分辨率、缩放比例和显示方向（备用方法）
+
+        每次 PowerShell 调用都有固定开销，合并查询后只需调用一次。
+        """
+        values = {}
         try:
-            # 首先尝试使用WMI
-            ps_command = r"""
-            $display = Get-WmiObject -Namespace root\cimv2 `
-            -Class Win32_DesktopMonitor | Select-Object -First 1
-            if ($display -and $display.DisplayOrientation -ne $null) {
-                switch ($display.DisplayOrientation) {
-                    0 { "Landscape (横向)" }
-                    1 { "Portrait (纵向)" }
-                    2 { "Landscape (横向翻转)" }
-                    3 { "Portrait (纵向翻转)" }
-                    default { "Unknown" }
-                }
-            } else {
-                # 备用方法：使用CIM类获取分辨率
-                $cimDisplay = Get-CimInstance -Namespace root\cimv2 `
-                -ClassName Win32_VideoController | Select-Object -First 1
-                if ($cimDisplay) {
-                    $width = $cimDisplay.CurrentHorizontalResolution
-                    $height = $cimDisplay.CurrentVerticalResolution
-                    if ($height -gt $width) {
-                        "Portrait (纵向)"
-                    } else {
-                        "Landscape (横向)"
-                    }
-                }
-            }
-            """
-            result = subprocess.run(
-                ["powershell", "-Command", ps_command],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                creationflags=subprocess.CREATE_NO_WINDOW,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                orientation = result.stdout.strip()
-                if orientation and orientation != "Unknown":
-                    return orientation
+            result = run_ps(self._encoded_display_query, timeout=self.timeout)
+            output = result.stdout.strip() if result.returncode == 0 else ""
+            if output:
+                data = json.loads(output)
+                if isinstance(data, dict):
+                    values = data
         except Exception as e:
-            logger.debug(f"获取显示方向失败: {e}")
+            logger.debug(f"获取显示参数失败: {e}")
+
+        return {
+            "primary_resolution": self._parse_resolution(values.get("Resolution")),
+            "scaling_factor": self._parse_scaling(values.get("Scaling")),
+            "orientation": self._parse_orientation(values.get("Orientation")),
+        }
+
+    def _parse_resolution(self, value: Optional[str]) -> Optional[str]:
+        """校验分辨率输出，避免返回明显错误的值"""
+        match = RES_RE.search(value) if value else None
+        if match:
+            return format_resolution(int(match[1]), int(match[2]))
+        return None
+
+    def _parse_scaling(self, value: Any) -> Optional[int]:
+        """校验缩放比例输出"""
+        try:
+            scaling = int(value) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+        # 验证缩放比例是否合理
+        if scaling is not None and 100 <= scaling <= 300:
+            return scaling
         return None
 
+    def _parse_orientation(self, value: Any) -> Optional[str]:
+        """将显示方向代码转换为显示文本"""
+        try:
+            return _ORIENTATION_NAMES.get(int(value)) if value is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    def _validate_resolution(self, resolution: str) -> Dict[str, Any]:
+        """验证分辨率是否符合要求（最低 1920x1080）"""
+        match = RES_RE.search(resolution)
+        if not match:
+            return {"valid": True, "message": "无法验证分辨率"}
+
+        width, height = int(match[1]), int(match[2])
+        if width < 1920 or height < 1080:
+            return {
+                "valid": False,
+                "severity": "error",
+                "message": f"分辨率过低: {resolution}",
+            }
+        return {"valid": True, "message": f"分辨率正常: {resolution}"}
+
     def get_fix_suggestion(self, result: Dict[str, Any]) -> str:
         """获取修复建议"""
         details = result.get("details", {})
@@ -0,0 +1,42 @@
+"""
+检测器公共工具测试
+验证探测结果缓存和分辨率格式化
+"""
+
+import pytest
+
+from oops.detectors.common import cache_success, format_resolution
+
+
+@pytest.mark.parametrize("failure", [None, {}, "Unknown"])
+def test_cache_success_skips_failures(failure):
+    """失败的结果不缓存，成功后按参数缓存"""
+    results = {"a": [failure, "SSD"], "b": ["HDD"]}
+    calls = []
+
+    @cache_success
+    def probe(key):
+        calls.append(key)
+        return results[key].pop(0)
+
+    assert probe("a") == failure
+    assert probe("a") == "SSD"
+    assert probe("a") == "SSD"
+    assert probe("b") == "HDD"
+    assert probe("b") == "HDD"
+    assert calls == ["a", "a", "b"]
+
+
+@pytest.mark.parametrize(
+    "width, height, expected",
+    [
+        (1920, 1080, "1920 x 1080"),
+        (7680, 4320, "7680 x 4320"),
+        (640, 480, None),
+        (0, 0, None),
+        (10000, 1080, None),
+    ],
+)
+def test_format_resolution(width, height, expected):
+    """测试分辨率范围校验和格式化"""
+    assert format_resolution(width, height) == expected
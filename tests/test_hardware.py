@@ -0,0 +1,81 @@
+"""
+硬件信息检测测试
+验证展示格式化和分辨率、屏幕比例校验
+"""
+
+import pytest
+
+from oops.detectors.hardware import HardwareDetector
+
+
+@pytest.fixture(scope="module")
+def detector():
+    """整个模块共用一个 HardwareDetector 实例"""
+    return HardwareDetector()
+
+
+def test_format_for_display(detector):
+    """测试数值格式化，且保持各项原有顺序"""
+    display = detector._format_for_display(
+        {
+            "cpu": {
+                "cores_logical": 8,
+                "freq_current_mhz": 3400.0,
+                "freq_max_mhz": None,
+                "model": "Test CPU",
+            },
+            "memory": {
+                "total_bytes": 16 * 1024**3,
+                "available_bytes": 8 * 1024**3,
+                "used_bytes": 8 * 1024**3,
+                "percent": 50.0,
+            },
+            "gpu": None,
+            "storage": {},
+        }
+    )
+
+    assert list(display["cpu"].items()) == [
+        ("cores_logical", 8),
+        ("freq_current", "3400 MHz"),
+        ("model", "Test CPU"),
+    ]
+    assert list(display["memory"].items()) == [
+        ("total", "16.0 GB"),
+        ("available", "8.0 GB"),
+        ("used", "8.0 GB"),
+        ("percent", "50.0%"),
+    ]
+    assert display["gpu"] is None
+    assert display["storage"] == {}
+
+
+@pytest.mark.parametrize(
+    "current, required, expected",
+    [
+        ("1920 x 1080", "1920x1080", True),
+        ("1600 x 900", "1920X1080", False),
+        ("2560×1440", "1920x1080", True),
+        ("unknown", "1920x1080", True),
+        ("1920 x 1080", 1080, True),
+        ("1920 x 1080", None, True),
+    ],
+)
+def test_check_resolution_requirement(detector, current, required, expected):
+    """测试分辨率要求校验（无法解析时跳过）"""
+    assert detector._check_resolution_requirement(current, required) is expected
+
+
+@pytest.mark.parametrize(
+    "resolution, valid",
+    [
+        ("1920 x 1080", True),
+        ("1920 x 1200", False),
+        ("0 x 1080", True),
+        ("1920 x 0", True),
+        ("unknown", True),
+    ],
+)
+def test_check_aspect_ratio(detector, resolution, valid):
+    """测试屏幕比例校验（宽或高为 0 时视为无法解析）"""
+    assert detector._check_aspect_ratio(resolution, "16:9")["valid"] is valid
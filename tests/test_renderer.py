@@ -0,0 +1,35 @@
+"""
+HTML渲染器测试
+验证 HTMLRenderer 的页脚和友情链接模板
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def renderer():
+    """整个模块共用一个 HTMLRenderer 实例"""
+    from oops.core.html_renderer import HTMLRenderer
+
+    return HTMLRenderer()
+
+
+def test_html_footer(renderer):
+    """测试页脚模板"""
+    assert "</html>" in renderer._get_html_footer()
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        ((), ["🔗 友情链接", "OOPS 力荐"]),
+        (({"测试链接": "https://example.com"},), ["测试链接"]),
+        (({"测试链接": "https://example.com"}, "测试项目"), ["测试项目 专属"]),
+    ],
+    ids=["default", "project_links", "project_name"],
+)
+def test_html_friend_links_section(renderer, args, expected):
+    """测试友情链接模板（默认、项目自定义链接、项目名）"""
+    html = renderer._get_html_friend_links_section(*args)
+    for text in expected:
+        assert text in html
@@ -0,0 +1,84 @@
+"""
+系统设置检测测试
+验证检测结果缓存和显示设置解析
+"""
+
+import pytest
+
+from oops.detectors import system_settings
+from oops.detectors.system_settings import SystemSettingsDetector
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    """启用检测并替换显示设置读取，记录读取次数"""
+    SystemSettingsDetector.clear_cache()
+    detector = SystemSettingsDetector()
+    detector._enabled = True
+    calls = []
+
+    def fake_settings():
+        calls.append(1)
+        return {"is_admin": True, "primary_resolution": "1920 x 1080"}
+
+    monkeypatch.setattr(detector, "_get_display_settings", fake_settings)
+    detector.calls = calls
+    yield detector
+    SystemSettingsDetector.clear_cache()
+
+
+def test_check_cache_hit(detector):
+    """相同配置在有效期内复用上次结果"""
+    config = {"checks": {"system_settings": {"require_admin": True}}}
+    first = detector.check(config)
+    second = detector.check(config)
+
+    assert second == first
+    assert len(detector.calls) == 1
+
+
+def test_check_cache_miss_on_config_change(detector):
+    """配置变化时重新检测"""
+    detector.check({"checks": {"system_settings": {"require_admin": True}}})
+    detector.check({"checks": {"system_settings": {"require_admin": False}}})
+
+    assert len(detector.calls) == 2
+
+
+def test_check_cache_expiry(detector):
+    """缓存过期后重新检测"""
+    config = {"checks": {"system_settings": {}}}
+    detector.check(config)
+    system_settings._CHECK_CACHE["ts"] -= system_settings._CACHE_TTL
+    detector.check(config)
+
+    assert len(detector.calls) == 2
+
+
+def test_clear_cache(detector):
+    """清空缓存后重新检测"""
+    config = {"checks": {"system_settings": {}}}
+    detector.check(config)
+    SystemSettingsDetector.clear_cache()
+    detector.check(config)
+
+    assert len(detector.calls) == 2
+    assert system_settings._SETTINGS_CACHE["data"] is None
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(125, 125), ("150", 150), (99, None), (301, None), ("abc", None), (None, None)],
+)
+def test_parse_scaling(value, expected):
+    """测试缩放比例校验"""
+    assert SystemSettingsDetector()._parse_scaling(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [(0, "Landscape (横向)"), ("0", "Landscape (横向)"), (9, None), ("x", None)],
+)
+def test_parse_orientation(value, expected):
+    """测试显示方向代码转换"""
+    assert SystemSettingsDetector()._parse_orientation(value) == expected